@@ -1,23 +1,34 @@
+import asyncio
+import functools
 import subprocess
 import time
 import numpy as np
 import pyaudio
 import os
-from pydub import AudioSegment
-from threading import Event, Thread
+import tempfile
+from threading import Event, Lock, Thread
 from stem_splitter import StemSplitter
 
+SAMPLE_RATE = 44100
+DRIFT_LOG_SIZE = 1024  # Drift corrections buffered between log drains
+DRIFT_CONVERGE_PERIODS = 50  # Buffer periods over which residual drift is resampled away
+MAX_RATE_DEVIATION = 0.002  # Largest playback speed change used to correct drift (~3.5 cents)
+DRIFT_DEAD_BAND = 16  # Samples of drift (~0.36 ms) tolerated before resampling kicks in
+MAX_CLOCK_ERROR = 500e-6  # Clock rate error tolerated before resampling kicks in
+
 class BluetoothDevice:
     def __init__(self, address, name):
         self.address = address
         self.name = name
         self.connected = False
 
-    def connect(self):
+    async def connect(self):
         try:
-            result = subprocess.run(['bluetoothconnector', '--connect', self.address],
-                                 capture_output=True, text=True)
-            self.connected = result.returncode == 0
+            process = await asyncio.create_subprocess_exec('bluetoothconnector', '--connect', self.address,
+                                                           stdout=asyncio.subprocess.PIPE,
+                                                           stderr=asyncio.subprocess.PIPE)
+            await process.communicate()
+            self.connected = process.returncode == 0
             return self.connected
         except Exception as e:
             print(f"Error connecting to {self.name}: {e}")
@@ -31,16 +42,68 @@ class BluetoothDevice:
         except Exception as e:
             print(f"Error disconnecting from {self.name}: {e}")
 
+async def connect_devices(devices):
+    """Connect to all devices concurrently, returning each device's result"""
+    return await asyncio.gather(*(device.connect() for device in devices))
+
+class ClockFilter:
+    """
+    Two-state Kalman filter tracking where a stream's DAC clock says playback
+    should be, as (sample position, samples per buffer period).
+    """
+    
+    def __init__(self, rate, measurement_noise=256.0 ** 2, position_noise=1.0, rate_noise=1e-4):
+        self.rate = float(rate)
+        self.r = measurement_noise
+        self.q_position = position_noise
+        self.q_rate = rate_noise
+        self.position = None
+    
+    def reset(self, measured):
+        """Restart the filter at a measured position"""
+        self.position = float(measured)
+        self.p00, self.p01, self.p11 = self.r, 0.0, 1.0
+    
+    def update(self, measured):
+        """Advance one buffer period and fold in a new clock reading"""
+        if self.position is None:
+            self.reset(measured)
+            return self.position
+        
+        # Predict one period ahead
+        self.position += self.rate
+        p00 = self.p00 + 2 * self.p01 + self.p11 + self.q_position
+        p01 = self.p01 + self.p11
+        p11 = self.p11 + self.q_rate
+        
+        # A jump this large is an underrun or clock discontinuity, not jitter
+        residual = measured - self.position
+        if residual * residual > 9 * (p00 + self.r):
+            self.reset(measured)
+            return self.position
+        
+        # Correct with the measurement
+        k0 = p00 / (p00 + self.r)
+        k1 = p01 / (p00 + self.r)
+        self.position += k0 * residual
+        self.rate += k1 * residual
+        self.p00 = (1 - k0) * p00
+        self.p01 = (1 - k0) * p01
+        self.p11 = p11 - k1 * p01
+        return self.position
+
 class AudioManager:
-    def __init__(self, audio_file, use_stems=False, stem_config=None):
+    def __init__(self, audio_file, use_stems=False, stem_config=None, sync_offset_ms=0):
         self.audio_file = audio_file
         self.use_stems = use_stems
         self.stem_splitter = None
+        self._channel_file = None
         self.stem_config = stem_config or {'left': ['vocals', 'other'], 'right': ['drums', 'bass']}
         
         # Apply a slight delay to compensate for Bluetooth latency differences
         # This is configurable and may need adjustment based on your specific devices
-        self.sync_offset_ms = 0  # Start with no offset, adjust as needed
+        self.sync_offset_ms = sync_offset_ms
+        self.buffer_size = 1024  # Smaller buffer size for better sync
         
         if use_stems:
             self._load_stems()
@@ -49,43 +112,43 @@ class AudioManager:
             
         self.pa = pyaudio.PyAudio()
         self.streams = {}
-        self.buffer_size = 1024  # Smaller buffer size for better sync
+        
+        # Shared clock epoch: latched by whichever stream calls back first, so
+        # every stream measures its position on the same timeline
+        self._clock_lock = Lock()
+        self._dac_epoch = None
+        
+        # Set once every stream has played to the end or aborted
+        self.playback_done = Event()
+        self._stream_lock = Lock()
+        self._stream_count = 0
+        self._finished_streams = 0
+        
+        # Drift corrections are recorded in a preallocated ring by the
+        # callbacks and printed from a background thread, keeping I/O out
+        # of the realtime path
+        self._drift_log = [0] * DRIFT_LOG_SIZE
+        self._drift_head = 0
+        self._stop_logging = Event()
+        Thread(target=self._drain_drift_log, daemon=True).start()
     
     def _load_stereo(self):
         """Load a stereo audio file and split into left and right channels"""
-        self.audio = AudioSegment.from_mp3(self.audio_file)
-        
-        if self.audio.channels != 2:
-            raise ValueError("Audio file must be stereo")
-        
-        # Split into separate channels
-        self.left_audio = self.audio.split_to_mono()[0]
-        self.right_audio = self.audio.split_to_mono()[1]
-        
-        # Apply any sync offset if needed
-        if self.sync_offset_ms > 0:
-            # Add silence to the beginning of the left channel
-            self.left_audio = AudioSegment.silent(duration=self.sync_offset_ms) + self.left_audio
-        elif self.sync_offset_ms < 0:
-            # Add silence to the beginning of the right channel
-            self.right_audio = AudioSegment.silent(duration=-self.sync_offset_ms) + self.right_audio
-        
-        # Make sure both channels are the same length
-        max_length = max(len(self.left_audio), len(self.right_audio))
-        if len(self.left_audio) < max_length:
-            self.left_audio = self.left_audio + AudioSegment.silent(duration=max_length - len(self.left_audio))
-        if len(self.right_audio) < max_length:
-            self.right_audio = self.right_audio + AudioSegment.silent(duration=max_length - len(self.right_audio))
-        
-        # Convert to numpy arrays and normalize
-        self.left_channel = np.array(self.left_audio.get_array_of_samples()).astype(np.float32)
-        self.right_channel = np.array(self.right_audio.get_array_of_samples()).astype(np.float32)
-        
-        # Normalize to [-1.0, 1.0]
-        self.left_channel = self.left_channel / (1 << (8 * self.audio.sample_width - 1))
-        self.right_channel = self.right_channel / (1 << (8 * self.audio.sample_width - 1))
-        
-        self.sample_rate = self.audio.frame_rate
+        # Let ffmpeg resample to a fixed rate and stereo layout, so a single
+        # decode is all we need (no probe pass). Spleeter also outputs 44.1 kHz.
+        self.sample_rate = SAMPLE_RATE
+        
+        # Decode straight to interleaved float32 on disk and map it, so the
+        # decoded track is paged in on demand instead of held in RAM
+        with tempfile.TemporaryFile() as pcm_file:
+            subprocess.run(['ffmpeg', '-nostdin', '-v', 'error', '-i', self.audio_file, '-vn',
+                            '-f', 'f32le', '-ac', '2', '-ar', str(self.sample_rate), '-'],
+                           stdout=pcm_file, check=True)
+            if os.fstat(pcm_file.fileno()).st_size == 0:
+                raise ValueError("Audio file contains no samples")
+            
+            samples = np.memmap(pcm_file, dtype=np.float32, mode='r').reshape(-1, 2)
+            self._align_channels(samples[:, 0], samples[:, 1])
     
     def _load_stems(self):
         """Separate audio into stems and combine them according to configuration"""
@@ -98,30 +161,60 @@ class AudioManager:
         stems = self.stem_splitter.separate(self.audio_file)
         
         # Combine stems for left and right channels according to configuration
-        self.left_channel, self.sample_rate = self.stem_splitter.combine_stems(self.stem_config['left'])
-        self.right_channel, _ = self.stem_splitter.combine_stems(self.stem_config['right'])
-        
-        # Apply any sync offset if needed
-        if self.sync_offset_ms > 0:
-            # Add silence to the beginning of the left channel
-            silence_samples = np.zeros(int(self.sync_offset_ms * self.sample_rate / 1000))
-            self.left_channel = np.concatenate([silence_samples, self.left_channel])
-        elif self.sync_offset_ms < 0:
-            # Add silence to the beginning of the right channel
-            silence_samples = np.zeros(int(-self.sync_offset_ms * self.sample_rate / 1000))
-            self.right_channel = np.concatenate([silence_samples, self.right_channel])
-        
-        # Make sure both channels are the same length
-        max_length = max(len(self.left_channel), len(self.right_channel))
-        if len(self.left_channel) < max_length:
-            self.left_channel = np.pad(self.left_channel, (0, max_length - len(self.left_channel)))
-        if len(self.right_channel) < max_length:
-            self.right_channel = np.pad(self.right_channel, (0, max_length - len(self.right_channel)))
+        left_channel, self.sample_rate = self.stem_splitter.combine_stems(self.stem_config['left'])
+        right_channel, _ = self.stem_splitter.combine_stems(self.stem_config['right'])
+        
+        self._align_channels(left_channel, right_channel)
+    
+    def _align_channels(self, left, right):
+        """Copy both channels into one shared playback buffer, applying the sync offset"""
+        offset_samples = int(abs(self.sync_offset_ms) * self.sample_rate / 1000)
+        
+        # Add silence to the beginning of the delayed channel
+        left_delay = offset_samples if self.sync_offset_ms > 0 else 0
+        right_delay = offset_samples if self.sync_offset_ms < 0 else 0
+        
+        # Pad the tail of the shorter channel so both end together, plus one
+        # extra buffer of silence so the callback can always slice a full buffer
+        self.num_frames = max(len(left) + left_delay, len(right) + right_delay)
+        
+        # Both channels live in a single (2, N) float32 buffer. PortAudio
+        # needs contiguous mono buffers, so each channel is a row view rather
+        # than a strided column of an interleaved array. The buffer is backed
+        # by an anonymous temp file so long tracks don't stay resident.
+        self._channel_file = tempfile.TemporaryFile()
+        self.channels = np.memmap(self._channel_file, dtype=np.float32, mode='w+',
+                                  shape=(2, self.num_frames + self.buffer_size))
+        self.left_channel = self.channels[0]
+        self.right_channel = self.channels[1]
+        
+        np.copyto(self.left_channel[left_delay:left_delay + len(left)], left, casting='unsafe')
+        np.copyto(self.right_channel[right_delay:right_delay + len(right)], right, casting='unsafe')
+    
+    def _log_drift(self, drift):
+        """Record a drift correction for the logging thread to print"""
+        with self._clock_lock:
+            self._drift_log[self._drift_head % DRIFT_LOG_SIZE] = int(drift)
+            self._drift_head += 1
+    
+    def _drain_drift_log(self):
+        """Print drift corrections recorded by the stream callbacks"""
+        tail = 0
+        while not self._stop_logging.wait(0.1):
+            head = self._drift_head
+            # Skip entries the callbacks have already overwritten
+            tail = max(tail, head - DRIFT_LOG_SIZE)
+            for i in range(tail, head):
+                print(f"Correcting drift of {self._drift_log[i % DRIFT_LOG_SIZE]} samples")
+            tail = head
     
     def cleanup(self):
         """Clean up resources"""
+        self._stop_logging.set()
         if self.stem_splitter:
             self.stem_splitter.cleanup()
+        if self._channel_file:
+            self._channel_file.close()
         
     def list_audio_devices(self):
         devices = []
@@ -132,62 +225,190 @@ class AudioManager:
         return devices
         
     def create_stream(self, device_info, channel_data):
-        return self.pa.open(
+        stream = self.pa.open(
             format=pyaudio.paFloat32,
             channels=1,
             rate=self.sample_rate,
             output=True,
             output_device_index=device_info['index'],
             frames_per_buffer=self.buffer_size,  # Use consistent buffer size
-            stream_callback=self._callback_factory(channel_data)
+            stream_callback=self._callback_factory(channel_data),
+            start=False  # Started together once every stream is open
         )
+        self._stream_count += 1
+        return stream
+    
+    def _finish_stream(self):
+        """Count a stream as done, signalling playback_done after the last one"""
+        with self._stream_lock:
+            self._finished_streams += 1
+            if self._finished_streams == self._stream_count:
+                self.playback_done.set()
     
     def _callback_factory(self, channel_data):
-        position = 0
-        start_time = None
+        position = None
+        resampling = False
+        clock = ClockFilter(self.buffer_size)
         
-        def callback(in_data, frame_count, time_info, status):
-            nonlocal position, start_time
+        # Values fixed for the life of the stream, bound once as closure cells
+        buffer_frames = self.buffer_size
+        snap_threshold = self.buffer_size * 2
+        sample_rate = self.sample_rate
+        num_frames = self.num_frames
+        silence = np.zeros(buffer_frames, dtype=np.float32)
+        
+        # Preallocated work buffers for the resampler
+        ramp = np.arange(buffer_frames, dtype=np.float64)
+        source_positions = np.empty(buffer_frames, dtype=np.float64)
+        source_floor = np.empty(buffer_frames, dtype=np.float64)
+        source_index = np.empty(buffer_frames, dtype=np.intp)
+        before = np.empty(buffer_frames, dtype=np.float32)
+        after = np.empty(buffer_frames, dtype=np.float32)
+        out_data = np.empty(buffer_frames, dtype=np.float32)
+        
+        def read_buffer(start, rate):
+            """
+            Read one full buffer starting at a fractional position, linearly resampled by rate.
+            
+            Linear interpolation is a mild low-pass that depends on the fractional
+            offset (about -3 dB near 11 kHz at half a sample), so it is only used
+            while correcting drift. Whole-sample starts at rate 1.0 are plain slices.
+            """
+            position = int(start)
+            offset = start - position
+            if offset == 0.0 and rate == 1.0:
+                return channel_data[position:position + buffer_frames]
+            
+            # Interpolate between the samples either side of each output frame.
+            # At the maximum rate the last frame reaches a few samples past the
+            # buffer, which the pre-padding covers.
+            chunk = channel_data[position:position + buffer_frames + 4]
+            np.multiply(ramp, rate, out=source_positions)
+            np.add(source_positions, offset, out=source_positions)
+            np.floor(source_positions, out=source_floor)
+            np.copyto(source_index, source_floor, casting='unsafe')
+            np.subtract(source_positions, source_floor, out=source_positions)
             
-            # Initialize start time on first callback for precise synchronization
-            if start_time is None:
-                start_time = time.time()
+            np.take(chunk, source_index, out=before, mode='clip')
+            np.take(chunk[1:], source_index, out=after, mode='clip')
+            np.subtract(after, before, out=after)
+            np.multiply(after, source_positions, out=after)
+            np.add(before, after, out=out_data)
+            return out_data
+        
+        def read_any(position, frame_count):
+            """
+            Read an unusually sized buffer without resampling. The next read
+            starts from the rate-adjusted position, so the correction still lands.
+            """
+            position = int(position)
+            padded = np.zeros(frame_count, dtype=np.float32)
+            chunk = channel_data[position:position + frame_count]
+            padded[:len(chunk)] = chunk
+            return padded
+        
+        def play(frame_count, time_info):
+            nonlocal position, resampling
+            
+            # PortAudio reports when this buffer will hit the DAC, so drift is
+            # measured against the device clock rather than wall time. The
+            # epoch is shared, so both streams follow the same timeline.
+            dac_position = int(time_info['output_buffer_dac_time'] * sample_rate)
+            if self._dac_epoch is None:
+                with self._clock_lock:
+                    if self._dac_epoch is None:
+                        self._dac_epoch = dac_position
             
-            # Calculate expected position based on elapsed time
-            # This helps keep both streams in sync even if callbacks occur at different times
-            elapsed_time = time.time() - start_time
-            expected_position = int(elapsed_time * self.sample_rate)
+            # Smooth out timestamp jitter before comparing against our position
+            expected_position = clock.update(dac_position - self._dac_epoch)
+            if position is None:
+                # A lower-latency stream can reach its DAC before the shared
+                # timeline starts; stay silent until it does, then join in step
+                if expected_position < 0:
+                    if frame_count != buffer_frames:
+                        return (np.zeros(frame_count, dtype=np.float32), pyaudio.paContinue)
+                    return (silence, pyaudio.paContinue)
+                position = float(round(expected_position))
             
-            # Correct drift if it's significant (more than 2 buffer sizes)
+            # Snap if we're more than 2 buffer sizes out. Small drift and clock
+            # error are left alone so playback stays bit-exact; past the dead
+            # band, follow the filtered clock rate and resample the drift away
+            # over the next few periods, then return to whole-sample slices.
             drift = expected_position - position
-            if abs(drift) > self.buffer_size * 2:
-                print(f"Correcting drift of {drift} samples")
-                position = expected_position
+            clock_error = abs(clock.rate / buffer_frames - 1.0)
+            landing = False
+            if abs(drift) > snap_threshold:
+                position = float(max(0, round(expected_position)))
+                self._log_drift(drift)
+                resampling = False
+            elif not resampling:
+                resampling = abs(drift) > DRIFT_DEAD_BAND or clock_error > MAX_CLOCK_ERROR
+            elif abs(drift) < 1.0 and clock_error <= MAX_CLOCK_ERROR:
+                # Drift is corrected; only drop back to plain slices once the
+                # read head sits on a whole sample, so the switch is seamless
+                if abs(position - round(position)) < 1e-3:
+                    resampling = False
+                    position = float(round(position))
+                else:
+                    landing = True
             
-            if position >= len(channel_data):
-                return (np.zeros(frame_count, dtype=np.float32), pyaudio.paComplete)
+            if landing:
+                # Stretch this buffer by under half a sample so the next one
+                # starts exactly on a whole sample
+                rate = (round(position) + frame_count - position) / frame_count
+            elif resampling:
+                rate = clock.rate / buffer_frames + drift / (buffer_frames * DRIFT_CONVERGE_PERIODS)
+                rate = min(max(rate, 1.0 - MAX_RATE_DEVIATION), 1.0 + MAX_RATE_DEVIATION)
+            else:
+                rate = 1.0
             
-            # Get the next chunk of audio data
-            out_data = channel_data[position:position + frame_count]
-            position += frame_count
+            start = position
+            position += frame_count * rate
             
-            # Pad with zeros if we don't have enough data
-            if len(out_data) < frame_count:
-                out_data = np.pad(out_data, (0, frame_count - len(out_data)))
+            if start >= num_frames:
+                # PortAudio stops calling back after paComplete, so this runs once per stream
+                self._finish_stream()
+                if frame_count != buffer_frames:
+                    return (np.zeros(frame_count, dtype=np.float32), pyaudio.paComplete)
+                return (silence, pyaudio.paComplete)
             
-            return (out_data.astype(np.float32), pyaudio.paContinue)
+            # Steady state: PortAudio asks for exactly one buffer, and the
+            # channel is pre-padded so the slice is always full
+            if frame_count == buffer_frames:
+                return (read_buffer(start, rate), pyaudio.paContinue)
+            return (read_any(start, frame_count), pyaudio.paContinue)
+        
+        def callback(in_data, frame_count, time_info, status):
+            try:
+                return play(frame_count, time_info)
+            except Exception as e:
+                # Abort this stream, but still count it so playback_done fires
+                print(f"Error in audio callback: {e}")
+                self._finish_stream()
+                return (np.zeros(frame_count, dtype=np.float32), pyaudio.paAbort)
         return callback
 
+@functools.lru_cache(maxsize=1)
+def _inquiry_raw():
+    """Run a Bluetooth inquiry once and cache its raw output"""
+    # Raise on failure so a bad scan isn't cached; lru_cache only stores returns
+    result = subprocess.run(['bluetoothconnector', '--inquiry'],
+                         capture_output=True, text=True, check=True)
+    if not result.stdout.strip():
+        raise RuntimeError("Bluetooth inquiry returned no devices")
+    return result.stdout
+
+def refresh_bluetooth_devices():
+    """Forget the cached inquiry so the next lookup rescans"""
+    _inquiry_raw.cache_clear()
+
 def get_bluetooth_devices():
     try:
-        result = subprocess.run(['bluetoothconnector', '--inquiry'],
-                             capture_output=True, text=True)
         devices = []
-        for line in result.stdout.split('\n'):
-            if ' - ' in line:
-                address = line.split(' - ')[0].strip()
-                name = line.split(' - ')[1].strip()
-                devices.append(BluetoothDevice(address, name))
+        for line in _inquiry_raw().split('\n'):
+            address, separator, name = line.partition(' - ')
+            if separator:
+                devices.append(BluetoothDevice(address.strip(), name.strip()))
         return devices
     except Exception as e:
         print(f"Error listing Bluetooth devices: {e}")
@@ -207,16 +428,12 @@ def main(audio_file_path, sync_offset_ms=0, use_stems=False, stem_config=None):
     # Initialize audio manager
     print("\nStep 1: Loading audio file...")
     try:
-        # Create audio manager with stem separation if requested
-        audio_manager = AudioManager(audio_file_path, use_stems=use_stems, stem_config=stem_config)
-        
-        # Apply any sync offset specified
-        audio_manager.sync_offset_ms = sync_offset_ms
         if sync_offset_ms != 0:
             print(f"  - Applying sync offset of {sync_offset_ms}ms")
-            # Reload audio with the new offset
-            audio_manager = AudioManager(audio_file_path, use_stems=use_stems, stem_config=stem_config)
-            audio_manager.sync_offset_ms = sync_offset_ms
+        
+        # Create audio manager with stem separation if requested
+        audio_manager = AudioManager(audio_file_path, use_stems=use_stems, stem_config=stem_config,
+                                     sync_offset_ms=sync_offset_ms)
         
         if use_stems:
             print(f"  - Using stem separation with configuration:")
@@ -225,7 +442,7 @@ def main(audio_file_path, sync_offset_ms=0, use_stems=False, stem_config=None):
             
         print(f"✓ Successfully loaded {audio_file_path}")
         print(f"  - Sample rate: {audio_manager.sample_rate} Hz")
-        print(f"  - Duration: {len(audio_manager.left_channel) / audio_manager.sample_rate:.2f} seconds")
+        print(f"  - Duration: {audio_manager.num_frames / audio_manager.sample_rate:.2f} seconds")
     except Exception as e:
         print(f"✗ Error loading audio file: {e}")
         return
@@ -248,20 +465,20 @@ def main(audio_file_path, sync_offset_ms=0, use_stems=False, stem_config=None):
         device2 = devices[1]
         
         print(f"\nStep 3: Establishing connections...")
-        print(f"Connecting to {device1.name} (left channel)...")
-        if not device1.connect():
-            print(f"✗ Failed to connect to {device1.name}")
-            print("  Please ensure the device is powered on and in pairing mode")
-            return
-        print(f"✓ Connected to {device1.name}")
-
-        print(f"Connecting to {device2.name} (right channel)...")
-        if not device2.connect():
-            print(f"✗ Failed to connect to {device2.name}")
+        print(f"Connecting to {device1.name} (left channel) and {device2.name} (right channel)...")
+        results = asyncio.run(connect_devices([device1, device2]))
+        for device, connected in zip([device1, device2], results):
+            if connected:
+                print(f"✓ Connected to {device.name}")
+            else:
+                print(f"✗ Failed to connect to {device.name}")
+        
+        if not all(results):
             print("  Please ensure the device is powered on and in pairing mode")
-            device1.disconnect()
+            for device in (device1, device2):
+                if device.connected:
+                    device.disconnect()
             return
-        print(f"✓ Connected to {device2.name}")
 
         # Wait for devices to be ready
         print("\nStep 4: Preparing audio devices...")
@@ -299,16 +516,17 @@ def main(audio_file_path, sync_offset_ms=0, use_stems=False, stem_config=None):
         print("Starting synchronized playback...")
         print("Press Ctrl+C to stop playback")
         
-        # Start streams with precise timing
+        # Both streams are open but stopped, so start them back to back.
+        # The shared clock epoch keeps them on the same timeline from here on.
         stream1.start_stream()
-        # Minimal delay between stream starts
-        time.sleep(0.001)  
         stream2.start_stream()
 
-        # Wait for playback to complete
+        # Wait for playback to complete. The timeout lets Ctrl+C through and
+        # catches streams that stop without finishing, e.g. a dropped device.
         try:
-            while stream1.is_active() or stream2.is_active():
-                time.sleep(0.1)
+            while not audio_manager.playback_done.wait(0.5):
+                if not (stream1.is_active() or stream2.is_active()):
+                    break
         except KeyboardInterrupt:
             print("\nPlayback interrupted")
 
@@ -1,10 +1,9 @@
-import os
 import numpy as np
-from pydub import AudioSegment
-import tempfile
-import shutil
+from spleeter.audio.adapter import AudioAdapter
 from spleeter.separator import Separator
 
+SAMPLE_RATE = 44100  # Rate the pretrained Spleeter models operate at
+
 class StemSplitter:
     """
     A class to handle audio stem separation using Spleeter.
@@ -25,7 +24,7 @@ class StemSplitter:
             
         self.num_stems = num_stems
         self.separator = Separator(f'spleeter:{num_stems}stems')
-        self.temp_dir = None
+        self.audio_adapter = AudioAdapter.default()
         self.stems = {}
         
     def separate(self, audio_file):
@@ -38,45 +37,18 @@ class StemSplitter:
         Returns:
             dict: Dictionary of stem names to numpy arrays
         """
-        # Create a temporary directory for Spleeter output
-        self.temp_dir = tempfile.mkdtemp()
-        
         try:
-            # Run Spleeter to separate the stems
-            self.separator.separate_to_file(audio_file, self.temp_dir)
-            
-            # Get the base filename without extension
-            base_name = os.path.splitext(os.path.basename(audio_file))[0]
-            stems_dir = os.path.join(self.temp_dir, base_name)
+            # Decode the file and run Spleeter on the waveform in memory, so
+            # the stems never round-trip through WAV files on disk
+            waveform, sample_rate = self.audio_adapter.load(audio_file, sample_rate=SAMPLE_RATE)
+            prediction = self.separator.separate(waveform)
             
-            # Load each stem as a numpy array
+            # Store each stem as a mono float32 numpy array
             self.stems = {}
-            
-            if self.num_stems == 2:
-                stem_files = ['vocals.wav', 'accompaniment.wav']
-            elif self.num_stems == 4:
-                stem_files = ['vocals.wav', 'drums.wav', 'bass.wav', 'other.wav']
-            else:  # 5 stems
-                stem_files = ['vocals.wav', 'drums.wav', 'bass.wav', 'piano.wav', 'other.wav']
-                
-            for stem_file in stem_files:
-                stem_name = os.path.splitext(stem_file)[0]
-                stem_path = os.path.join(stems_dir, stem_file)
-                
-                # Load the stem audio
-                audio = AudioSegment.from_wav(stem_path)
-                
-                # Convert to mono and get numpy array
-                audio_mono = audio.set_channels(1)
-                samples = np.array(audio_mono.get_array_of_samples()).astype(np.float32)
-                
-                # Normalize to [-1.0, 1.0]
-                samples = samples / (1 << (8 * audio.sample_width - 1))
-                
-                # Store the stem
+            for stem_name, samples in prediction.items():
                 self.stems[stem_name] = {
-                    'samples': samples,
-                    'sample_rate': audio.frame_rate
+                    'samples': samples.mean(axis=1, dtype=np.float32),
+                    'sample_rate': sample_rate
                 }
                 
             return self.stems
@@ -103,29 +75,27 @@ class StemSplitter:
             if stem not in self.stems:
                 raise ValueError(f"Stem '{stem}' not found. Available stems: {list(self.stems.keys())}")
         
-        # Get the first stem to determine sample rate and length
+        # Start from a copy of the first stem to determine sample rate and length
         first_stem = self.stems[stem_names[0]]
         sample_rate = first_stem['sample_rate']
-        combined = np.zeros_like(first_stem['samples'])
+        combined = first_stem['samples'].copy()
         
-        # Add all stems together
-        for stem_name in stem_names:
-            combined += self.stems[stem_name]['samples']
+        # Add the remaining stems in place
+        for stem_name in stem_names[1:]:
+            np.add(combined, self.stems[stem_name]['samples'], out=combined)
             
-        # Normalize to prevent clipping
-        max_val = np.max(np.abs(combined))
+        # Normalize to prevent clipping, without allocating an abs() temporary
+        max_val = max(combined.max(), -combined.min())
         if max_val > 1.0:
-            combined = combined / max_val
+            np.multiply(combined, np.float32(1.0 / max_val), out=combined)
             
         return combined, sample_rate
         
     def cleanup(self):
         """
-        Clean up temporary files.
+        Release the separated stems.
         """
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-            self.temp_dir = None
+        self.stems = {}
             
     def __del__(self):
         """